@@ -13,6 +13,7 @@ from solar_consumer.fetch_data import fetch_data
 from solar_consumer.format_forecast import format_to_forecast_sql
 from solar_consumer.save_forecast import (
     save_forecasts_to_csv,
+    save_forecasts_to_parquet,
     save_forecasts_to_db,
     save_generation_to_site_db,
     save_forecasts_to_site_db,
@@ -34,8 +35,9 @@ def app(
 
     Parameters:
         db_url (str): Database connection URL from an environment variable.
-        save_method (str): Method to save the forecast data. Options are "db" or "csv".
-        csv_dir (str, optional): Directory to save CSV files if save_method is "csv".
+        save_method (str): Method to save the forecast data. Options are "db", "csv",
+            "parquet" or "site-db".
+        csv_dir (str, optional): Directory to save files if save_method is "csv" or "parquet".
         country (str): Country code for fetching data. Default is "uk".
         historic_or_forecast: (str): Type of data to fetch. Default is "generation".
     """
@@ -93,7 +95,12 @@ def app(
             logger.info(f"Saving {len(forecast_data)} rows of forecast data directly to CSV.")
             save_forecasts_to_csv(forecast_data, csv_dir=csv_dir)
 
-        # C. TODO: Potential new save methods
+        # C. Save directly to Parquet
+        elif save_method == "parquet":
+            logger.info(f"Saving {len(forecast_data)} rows of forecast data directly to Parquet.")
+            save_forecasts_to_parquet(forecast_data, parquet_dir=csv_dir)
+
+        # D. TODO: Potential new save methods
         elif save_method == "site-db":
 
             # Initialize database connection
@@ -137,8 +144,8 @@ if __name__ == "__main__":
     csv_dir = os.getenv("CSV_DIR")
     historic_or_forecast = os.getenv("HISTORIC_OR_FORECAST", "generation").lower()
 
-    if save_method == "csv" and not csv_dir:
-        logger.error("CSV_DIR environment variable is required for CSV saving. Exiting.")
+    if save_method in ["csv", "parquet"] and not csv_dir:
+        logger.error("CSV_DIR environment variable is required for CSV/Parquet saving. Exiting.")
         exit(1)
     if (save_method in ["db", "site-db"]) and (db_url is None):
         logger.error("DB_URL environment variable is not set. Exiting.")
@@ -1,29 +1,35 @@
 from loguru import logger
 from nowcasting_datamodel.save.save import save
 from pvsite_datamodel.write.generation import insert_generation_values
-from pvsite_datamodel.write.forecast import insert_forecast_values
-from pvsite_datamodel.read.site import get_site_by_client_site_name
 from pvsite_datamodel.write.user_and_site import create_site
 from pvsite_datamodel.pydantic_models import PVSiteEditMetadata as PVSite
+from pvsite_datamodel.read.model import get_or_create_model
+from pvsite_datamodel.sqlmodels import ForecastSQL, ForecastValueSQL, LocationSQL
 from sqlalchemy.orm.session import Session
+import glob
 import os
+import time
+import numpy as np
 import pandas as pd
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from typing import Iterable, Optional, Union
 
 # Default NL national site, and NL regional
-nl_national = PVSite(client_site_name="nl_national", latitude="52.13", longitude="5.29")
-nl_region_1 = PVSite(client_site_name="nl_region_1_groningen", latitude="53.22", longitude="6.74")
-nl_region_2 = PVSite(client_site_name="nl_region_2_friesland", latitude="53.11", longitude="5.85")
-nl_region_3 = PVSite(client_site_name="nl_region_3_drenthe", latitude="52.86", longitude="6.62")
-nl_region_4 = PVSite(client_site_name="nl_region_4_overijssel", latitude="52.45", longitude="6.45")
-nl_region_5 = PVSite(client_site_name="nl_region_5_flevoland", latitude="52.53", longitude="5.60")
-nl_region_6 = PVSite(client_site_name="nl_region_6_gelderland", latitude="52.06", longitude="5.95")
-nl_region_7 = PVSite(client_site_name="nl_region_7_utrecht", latitude="52.08", longitude="5.17")
-nl_region_8 = PVSite(client_site_name="nl_region_8_noord_holland", latitude="52.58", longitude="4.87")
-nl_region_9 = PVSite(client_site_name="nl_region_9_zuid_holland", latitude="51.94", longitude="4.47")
-nl_region_10 = PVSite(client_site_name="nl_region_10_zeeland", latitude="51.45", longitude="3.84")
-nl_region_11 = PVSite(client_site_name="nl_region_11_noord_brabant", latitude="51.56", longitude="5.20")
-nl_region_12 = PVSite(client_site_name="nl_region_12_limburg", latitude="51.21", longitude="5.94")
+nl_national = PVSite(client_site_name="nl_national", latitude=52.13, longitude=5.29)
+nl_region_1 = PVSite(client_site_name="nl_region_1_groningen", latitude=53.22, longitude=6.74)
+nl_region_2 = PVSite(client_site_name="nl_region_2_friesland", latitude=53.11, longitude=5.85)
+nl_region_3 = PVSite(client_site_name="nl_region_3_drenthe", latitude=52.86, longitude=6.62)
+nl_region_4 = PVSite(client_site_name="nl_region_4_overijssel", latitude=52.45, longitude=6.45)
+nl_region_5 = PVSite(client_site_name="nl_region_5_flevoland", latitude=52.53, longitude=5.60)
+nl_region_6 = PVSite(client_site_name="nl_region_6_gelderland", latitude=52.06, longitude=5.95)
+nl_region_7 = PVSite(client_site_name="nl_region_7_utrecht", latitude=52.08, longitude=5.17)
+nl_region_8 = PVSite(client_site_name="nl_region_8_noord_holland", latitude=52.58, longitude=4.87)
+nl_region_9 = PVSite(client_site_name="nl_region_9_zuid_holland", latitude=51.94, longitude=4.47)
+nl_region_10 = PVSite(client_site_name="nl_region_10_zeeland", latitude=51.45, longitude=3.84)
+nl_region_11 = PVSite(client_site_name="nl_region_11_noord_brabant", latitude=51.56, longitude=5.20)
+nl_region_12 = PVSite(client_site_name="nl_region_12_limburg", latitude=51.21, longitude=5.94)
 NL_NATIONAL_AND_REGIONS = {"0": nl_national,
                             "1": nl_region_1, "2": nl_region_2, "3": nl_region_3,
                             "4": nl_region_4, "5": nl_region_5, "6": nl_region_6,
@@ -33,10 +39,10 @@ NL_NATIONAL_AND_REGIONS = {"0": nl_national,
 
 # Germany Transmission System Operators (TSOs)
 # Coords ~direct to HQs
-de_50hertz = PVSite(client_site_name="50Hertz", latitude="52.53", longitude="13.37")
-de_amprion = PVSite(client_site_name="Amprion", latitude="51.52", longitude="7.45")
-de_tennet = PVSite(client_site_name="TenneT", latitude="52.38", longitude="5.17")
-de_transnetbw = PVSite(client_site_name="TransnetBW", latitude="48.78", longitude="9.18")
+de_50hertz = PVSite(client_site_name="50Hertz", latitude=52.53, longitude=13.37)
+de_amprion = PVSite(client_site_name="Amprion", latitude=51.52, longitude=7.45)
+de_tennet = PVSite(client_site_name="TenneT", latitude=52.38, longitude=5.17)
+de_transnetbw = PVSite(client_site_name="TransnetBW", latitude=48.78, longitude=9.18)
 DE_TSO_SITES = {"TransnetBW": de_transnetbw, "50Hertz": de_50hertz, "TenneT": de_tennet,
                 "Amprion": de_amprion}
 # Actual installed capacities (in kW) by TSO
@@ -44,6 +50,96 @@ DE_TSO_SITES = {"TransnetBW": de_transnetbw, "50Hertz": de_50hertz, "TenneT": de
 DE_TSO_CAPACITY = {"TransnetBW": 10_770_000, "50Hertz": 18_175_000, "TenneT": 21_882_000, 
                    "Amprion": 16_506_000}
 
+# Default NL installed capacity (in kW), used for all NL sites
+_NL_DEFAULT_CAPACITY_KW = 20_000_000
+
+# Sites, the generation data column identifying them, and default capacity (in kW) per country
+COUNTRY_SITES = {"nl": NL_NATIONAL_AND_REGIONS, "de": DE_TSO_SITES}
+COUNTRY_SITE_COLUMN = {"nl": "region_id", "de": "tso_zone"}
+COUNTRY_CAPACITY_RESOLVER = {
+    "nl": lambda _: _NL_DEFAULT_CAPACITY_KW,
+    "de": DE_TSO_CAPACITY.__getitem__,
+}
+
+# Generation data columns renamed for the site database, and forecast interval length
+_GEN_RENAME = {"solar_generation_kw": "power_kw", "target_datetime_utc": "start_utc"}
+_QUARTER_HOUR = np.timedelta64(15, "m")
+_NS_PER_MINUTE = 60_000_000_000
+
+# Below this many rows, splitting data per site with numpy beats pandas' groupby overhead
+_SMALL_FRAME_ROWS = 10_000
+
+# Maximum number of forecast values sent to the database in one insert
+FORECAST_INSERT_CHUNK_SIZE = int(os.getenv("FORECAST_INSERT_CHUNK_SIZE", "10000"))
+
+# Single background thread for CSV writes, created on first use of `background=True`
+_CSV_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+# Number of days timestamped forecast CSV and Parquet files are kept for
+CSV_RETENTION_DAYS = int(os.getenv("CSV_RETENTION_DAYS", "7"))
+
+
+def get_existing_pvsites(session: Session, pvsites: Iterable[PVSite]) -> dict:
+    """
+    Retrieve all existing PVsite records for the given sites with a single query
+
+    Parameters:
+        session (Session): Current SQLAlchemy session
+        pvsites (Iterable[PVSite]): Pydantic models with site metadata
+
+    Returns:
+        dict: Site model instances keyed by client site name, missing sites are left out
+    """
+
+    client_site_names = [pvsite.client_site_name for pvsite in pvsites]
+    sites = (
+        session.query(LocationSQL)
+        .filter(LocationSQL.client_location_name.in_(client_site_names))
+        .all()
+    )
+    return {site.client_location_name: site for site in sites}
+
+
+def create_pvsite(
+    session: Session, pvsite: PVSite, country: str, capacity_override_kw: Optional[int] = None,
+):
+    """
+    Create a PVsite record, without checking whether it exists already
+
+    If `capacity_override_kw` is provided, that value will be used when creating the site.
+    For Germany, the TSO’s known capacity is used if no override is given. For NL, default 20GW applied
+
+    Parameters:
+        session (Session): Current SQLAlchemy session
+        pvsite (PVSite): Pydantic model with site metadata
+        country (str): Country code ('nl' or 'de')
+        capacity_override_kw (Optional[int]): Force a specific capacity on creation
+
+    Returns:
+        site: The created site model instance
+    """
+
+    logger.info(f"Creating site {pvsite.client_site_name} in the database.")
+
+    # Choose capacity based on country; per-TSO for de; nl only has 20GW hard‑coded
+    if capacity_override_kw is not None:
+        capacity = capacity_override_kw
+    else:
+        capacity = COUNTRY_CAPACITY_RESOLVER[country](pvsite.client_site_name)
+
+    site, _ = create_site(
+        session=session,
+        latitude=pvsite.latitude,
+        longitude=pvsite.longitude,
+        client_site_name=pvsite.client_site_name,
+        client_site_id=1,
+        country=country,
+        capacity_kw=capacity,
+        dno="", # these are UK specific things
+        gsp="", # these are UK specific things
+    )
+    return site
+
 
 def get_or_create_pvsite(
     session: Session, pvsite: PVSite, country: str, capacity_override_kw: Optional[int] = None,
@@ -64,34 +160,10 @@ def get_or_create_pvsite(
         site: The existing/created site model instance
     """                    
 
-    try:
-        site = get_site_by_client_site_name(
-            session=session,
-            client_site_name=pvsite.client_site_name,
-            client_name=pvsite.client_site_name, # this is not used
-        )
-    except Exception:
-        logger.info(f"Creating site {pvsite.client_site_name} in the database.")
-        
-        # Choose capacity based on country; per-TSO for de; nl only has 20GW hard‑coded
-        if capacity_override_kw is not None:
-            capacity = capacity_override_kw
-        elif country == "de":
-            capacity = DE_TSO_CAPACITY[pvsite.client_site_name]
-        else:
-            capacity = 20_000_000
-        
-        site, _ = create_site(
-            session=session,
-            latitude=pvsite.latitude,
-            longitude=pvsite.longitude,
-            client_site_name=pvsite.client_site_name,
-            client_site_id=1,
-            country=country,
-            capacity_kw=capacity,
-            dno="", # these are UK specific things
-            gsp="", # these are UK specific things
-        )
+    # A missing site is a normal lookup result, so database errors are not mistaken for it
+    site = get_existing_pvsites(session, [pvsite]).get(pvsite.client_site_name)
+    if site is None:
+        site = create_pvsite(session, pvsite, country, capacity_override_kw=capacity_override_kw)
     return site
 
 def update_capacity(
@@ -99,7 +171,7 @@ def update_capacity(
 ):
     """
     Update stored site capacity if the override is higher. Only runs when importing generation
-    data so DB always reflects highest observed capacity.
+    data so DB always reflects highest observed capacity. The change is committed by the caller.
 
     Parameters:
         session (Session): Active session
@@ -113,12 +185,32 @@ def update_capacity(
     if capacity_override_kw is not None and capacity_override_kw > site.capacity_kw + 1.0:
         old_site_capacity_kw = site.capacity_kw
         site.capacity_kw = capacity_override_kw
-        session.commit()
         logger.info(
             f"Updated site {site.client_location_name} capacity from {old_site_capacity_kw } to {site.capacity_kw} kW."
         )
   
 
+def _split_by_site(generation_data: pd.DataFrame, site_column: str) -> dict:
+    """
+    Split generation data into one DataFrame per site key, dropping rows without a key
+
+    Parameters:
+        generation_data (pd.DataFrame): Generation data to split
+        site_column (str): Column holding the site key ('tso_zone' or 'region_id')
+
+    Returns:
+        dict: DataFrames keyed by site key
+    """
+
+    if len(generation_data) < _SMALL_FRAME_ROWS:
+        codes, zones = pd.factorize(generation_data[site_column])
+        return {
+            zone: generation_data.iloc[np.flatnonzero(codes == i)] for i, zone in enumerate(zones)
+        }
+
+    return dict(list(generation_data.groupby(site_column, observed=True, sort=False)))
+
+
 def save_generation_to_site_db(
     generation_data: pd.DataFrame, session: Session, country: str = "nl"
 ):
@@ -144,54 +236,138 @@ def save_generation_to_site_db(
         return
 
     # Determine country
-    if country == "nl":
-        country_sites = NL_NATIONAL_AND_REGIONS
-    elif country == "de":
-        country_sites = DE_TSO_SITES
-    else:
+    if country not in COUNTRY_SITES:
         raise Exception("Only generation data from the following countries is supported \
             when saving: 'nl', 'de'")
+    country_sites = COUNTRY_SITES[country]
+    site_column = COUNTRY_SITE_COLUMN[country]
 
-    # Loop per site
-    for key, pvsite in country_sites.items():
-        
-        # Filter by TSO for Germany, or use all data for NL
-        if country == "de":
-            generation_data_tso_df = generation_data[generation_data["tso_zone"] == key].copy()
-        elif country == "nl":
-            generation_data_tso_df = generation_data[generation_data["region_id"] == int(key)].copy()
-        else:
-            generation_data_tso_df = generation_data.copy()
-            
-        if generation_data_tso_df.empty:
-            logger.debug(f"No rows for {key!r}, skipping")
-            continue
-
-        # Derive capacity override once (test expects max row value if present)
-        capacity_override = (
-            int(generation_data_tso_df["capacity_kw"].max())
-            if "capacity_kw" in generation_data_tso_df.columns
-            else None
+    # Store TSO zones as categorical codes so matching and grouping avoid rehashing strings
+    if country == "de":
+        generation_data = generation_data.assign(
+            tso_zone=pd.Categorical(generation_data["tso_zone"], categories=list(DE_TSO_SITES))
         )
 
-        # Create or fetch site and pass same override for any country
-        site = get_or_create_pvsite(session, pvsite, country, 
-                                    capacity_override_kw=capacity_override,)
+    # Key sites by their TSO for Germany, or by region for NL, and keep those with data
+    zone_sites = {
+        (key if country == "de" else int(key)): pvsite for key, pvsite in country_sites.items()
+    }
+    present_zones = set(generation_data[site_column].unique()) & zone_sites.keys()
+    if not present_zones:
+        logger.warning(f"No generation data for any known {country!r} site, nothing saved!")
+        return
+    present_sites = {
+        zone: pvsite for zone, pvsite in zone_sites.items() if zone in present_zones
+    }
+
+    # Fetch all known sites in one query, only missing ones are created below
+    existing_sites = get_existing_pvsites(session, present_sites.values())
 
-        # Prepare DataFrame, rename and insert
-        generation_data_tso_df = generation_data_tso_df.rename(
-            columns={
-                "solar_generation_kw": "power_kw",
-                "target_datetime_utc": "start_utc",
-            }
+    # Split the data per TSO for Germany, or per region for NL, in a single pass
+    site_groups = _split_by_site(generation_data, site_column)
+
+    # Loop per site, resolving each site once so all rows can be inserted together.
+    # Capacity updates and inserts for all sites are committed together, or not at all
+    site_uuids = {}
+    try:
+        for zone, pvsite in present_sites.items():
+            generation_data_tso_df = site_groups[zone]
+
+            # Derive capacity override once (test expects max row value if present)
+            capacity_override = (
+                int(generation_data_tso_df["capacity_kw"].max())
+                if "capacity_kw" in generation_data_tso_df.columns
+                else None
+            )
+
+            # Use the prefetched site, or create it and pass same override for any country
+            site = existing_sites.get(pvsite.client_site_name)
+            if site is None:
+                site = create_pvsite(session, pvsite, country,
+                                     capacity_override_kw=capacity_override,)
+            update_capacity(session, site, capacity_override_kw=capacity_override,)
+            site_uuids[zone] = site.location_uuid
+
+        # Prepare one DataFrame for all sites, dropping rows of unknown sites before any
+        # parsing, then rename and insert in a single statement
+        generation_df = generation_data.rename(columns=_GEN_RENAME).assign(
+            site_uuid=lambda df: df[site_column].map(site_uuids)
         )
-        generation_data_tso_df["start_utc"] = pd.to_datetime(generation_data_tso_df["start_utc"])
-        generation_data_tso_df["site_uuid"] = site.location_uuid
+        generation_df = generation_df.dropna(subset=["site_uuid"])
+
+        # Only parse start times that are not datetimes already (e.g. ISO strings)
+        if not pd.api.types.is_datetime64_any_dtype(generation_df["start_utc"]):
+            generation_df = generation_df.assign(
+                start_utc=pd.to_datetime(generation_df["start_utc"], format="ISO8601")
+            )
 
-        insert_generation_values(session=session, df=generation_data_tso_df)
+        insert_generation_values(session=session, df=generation_df)
         session.commit()
-        update_capacity(session, site, capacity_override_kw=capacity_override,)
-        logger.info(f"Successfully saved {len(generation_data_tso_df)} rows")
+    except Exception as e:
+        logger.error(f"An error occurred while saving generation data: {e}")
+        session.rollback()
+        raise e
+
+    logger.info(f"Successfully saved {len(generation_df)} rows")
+
+
+def insert_forecast_values_in_chunks(
+    session: Session,
+    forecast_meta: dict,
+    forecast_values_df: pd.DataFrame,
+    ml_model_name: Optional[str] = None,
+    ml_model_version: Optional[str] = None,
+    chunk_size: int = FORECAST_INSERT_CHUNK_SIZE,
+):
+    """
+    Insert forecast values for a single forecast, at most `chunk_size` rows at a time
+
+    Same behaviour as pvsite-datamodel's `insert_forecast_values` (1.2.0), including the
+    `site_uuid` to `location_uuid` remap and skipping the model when no name/version is
+    given. That function creates a new forecast on every call, so it cannot be called once
+    per chunk; all site forecasts are saved through this one instead.
+
+    Parameters:
+        session (Session): Active session
+        forecast_meta (dict): Meta info about the forecast values
+        forecast_values_df (pd.DataFrame): Forecast values to insert
+        ml_model_name (Optional[str]): Name of the ML model used to generate the forecast
+        ml_model_version (Optional[str]): Version of the ML model used to generate the forecast
+        chunk_size (int): Maximum number of rows per insert, at least 1
+
+    Returns:
+        None
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    if "site_uuid" in forecast_meta and "location_uuid" not in forecast_meta:
+        forecast_meta["location_uuid"] = forecast_meta.pop("site_uuid")
+
+    forecast = ForecastSQL(**forecast_meta)
+    session.add(forecast)
+    session.flush()  # Flush to get the forecast's primary key
+
+    if (ml_model_name is not None) and (ml_model_version is not None):
+        ml_model = get_or_create_model(session, ml_model_name, ml_model_version)
+        ml_model_uuid = ml_model.model_uuid
+    else:
+        ml_model_uuid = None
+
+    for start in range(0, len(forecast_values_df), chunk_size):
+        rows = forecast_values_df.iloc[start:start + chunk_size].to_dict("records")
+        session.bulk_save_objects(
+            [
+                ForecastValueSQL(
+                    **row,
+                    forecast_uuid=forecast.forecast_uuid,
+                    ml_model_uuid=ml_model_uuid,
+                )
+                for row in rows
+            ]
+        )
+    session.commit()
 
 
 def save_forecasts_to_site_db(
@@ -200,6 +376,7 @@ def save_forecasts_to_site_db(
     model_tag: str,
     model_version: str,
     country: str = "nl",
+    chunk_size: int = FORECAST_INSERT_CHUNK_SIZE,
 ):
     """Save generation data to the database.
 
@@ -210,6 +387,7 @@ def save_forecasts_to_site_db(
         model_tag (str): Model tag to fetch model metadata.
         model_version (str): Model version to fetch model metadata.
         country: (str): Country code for the generation data. Currently only 'nl' is supported.
+        chunk_size (int): Maximum number of forecast values sent in one insert, at least 1.
         
     Return:
         None
@@ -218,6 +396,9 @@ def save_forecasts_to_site_db(
     if country != "nl":
         raise Exception("Only NL forecast data is supported when saving (atm).")
 
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
     site = get_or_create_pvsite(session, nl_national, country)
 
     timestamp_utc = pd.Timestamp.now(tz="UTC").floor("15min")
@@ -228,29 +409,27 @@ def save_forecasts_to_site_db(
         "forecast_version": model_version,
     }
 
-    forecast_data.rename(
-        columns={
-            "solar_generation_kw": "forecast_power_kw",
-            "target_datetime_utc": "start_utc",
-        },
-        inplace=True,
+    # Build the insert frame in one go from only the columns needed
+    start_utc = pd.to_datetime(forecast_data["target_datetime_utc"], utc=True)
+    start_utc_ns = start_utc.to_numpy(dtype="datetime64[ns]").view("i8")
+    forecast_values_df = pd.DataFrame(
+        {
+            "forecast_power_kw": forecast_data["solar_generation_kw"].to_numpy(),
+            "start_utc": start_utc.array,
+            "end_utc": (start_utc + _QUARTER_HOUR).array,
+            # horizon in minutes, using integer nanoseconds since the epoch
+            "horizon_minutes": (start_utc_ns - timestamp_utc.value) // _NS_PER_MINUTE,
+        }
     )
 
-    # drop other rows and add end_utc
-    forecast_data = forecast_data[["forecast_power_kw", "start_utc"]]
-    forecast_data["end_utc"] = forecast_data["start_utc"] + pd.Timedelta(hours=0.25)
-
-    # calculate horizon minutes
-    forecast_data["horizon_minutes"] = (
-        forecast_data["start_utc"] - timestamp_utc
-    ).dt.total_seconds() / 60
-
-    insert_forecast_values(
-        forecast_values_df=forecast_data,
+    # Insert the values in chunks of at most chunk_size rows, all under one forecast
+    insert_forecast_values_in_chunks(
+        session=session,
         forecast_meta=forecast_meta,
+        forecast_values_df=forecast_values_df,
         ml_model_name=model_tag,
         ml_model_version=model_version,
-        session=session,
+        chunk_size=chunk_size,
     )
 
 
@@ -281,35 +460,203 @@ def save_forecasts_to_db(forecasts: list, session: Session):
         raise e
 
 
-def save_forecasts_to_csv(forecasts: pd.DataFrame, csv_dir: str):
-    """Save forecasts to a CSV file.
+def _timestamped_path(out_dir: str, extension: str) -> str:
+    """Return a new `forecast_data_<UTC timestamp>.<extension>` path in the directory.
+
+    Parameters:
+        out_dir (str): Directory the file goes in.
+        extension (str): File extension, e.g. "csv" or "parquet".
+
+    Return:
+        str: Path of the file, unique to the microsecond
+    """
+    timestamp_utc = pd.Timestamp.now(tz="UTC").strftime("%Y%m%dT%H%M%S%fZ")
+    return os.path.join(out_dir, f"forecast_data_{timestamp_utc}.{extension}")
+
+
+def _remove_old_forecast_files(
+    out_dir: str, extension: str, retention_days: int, keep_path: Optional[str] = None,
+):
+    """Remove timestamped forecast files older than the retention period.
+
+    Parameters:
+        out_dir (str): Directory holding the files.
+        extension (str): File extension, e.g. "csv" or "parquet".
+        retention_days (int): Number of days to keep files for, below 1 nothing is removed.
+        keep_path (Optional[str]): File that is never removed, e.g. the one just written.
+
+    Return:
+        None
+    """
+    if retention_days < 1:
+        return
+
+    cutoff = time.time() - retention_days * 24 * 60 * 60
+    for file_path in glob.glob(os.path.join(out_dir, f"forecast_data_*.{extension}")):
+        try:
+            if keep_path is not None and os.path.samefile(file_path, keep_path):
+                continue
+            if os.path.getmtime(file_path) < cutoff:
+                logger.info(f"Removing old forecast file {file_path}")
+                os.remove(file_path)
+        except FileNotFoundError:
+            continue  # already removed, e.g. by another process
+
+
+def _write_csv(forecasts: pd.DataFrame, csv_path: str) -> str:
+    """Write forecasts to a CSV file and tidy up old ones.
+
+    Runs in the caller's thread, or on the CSV writer thread when saving with `background=True`.
+
+    Parameters:
+        forecasts (pd.DataFrame): DataFrame containing forecast data to save.
+        csv_path (str): Path of the CSV file to write.
+
+    Return:
+        str: Path of the written CSV file
+    """
+    created = False
+    try:
+        logger.info(f"Saving forecasts to CSV at {csv_path}")
+        # "x" so an existing file is never overwritten
+        with open(csv_path, "xb", buffering=1 << 20) as csv_file:
+            created = True
+            try:
+                pacsv.write_csv(pa.Table.from_pandas(forecasts, preserve_index=False), csv_file)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                # e.g. mixed-type object or list columns, which only pandas can write.
+                # Start the file again, in case pyarrow wrote part of it
+                logger.warning(f"Falling back to pandas' CSV writer: {e}")
+                csv_file.seek(0)
+                csv_file.truncate()
+                forecasts.to_csv(csv_file, index=False)
+        logger.info(f"Successfully saved {len(forecasts)} forecasts to CSV.")
+    except Exception as e:
+        logger.error(f"An error occurred while saving forecasts to CSV: {e}")
+        # Don't leave a partial file behind, only one this call created
+        if created:
+            try:
+                os.remove(csv_path)
+            except OSError:
+                pass
+        raise e
+
+    # The CSV is saved at this point, so failing to tidy up old ones is only logged
+    try:
+        _remove_old_forecast_files(
+            os.path.dirname(csv_path), "csv", CSV_RETENTION_DAYS, keep_path=csv_path
+        )
+    except Exception as e:
+        logger.warning(f"An error occurred while removing old forecast CSVs: {e}")
+
+    return csv_path
+
+
+def _get_csv_executor() -> ThreadPoolExecutor:
+    """Return the CSV writer thread pool, creating it on first use.
+
+    Return:
+        ThreadPoolExecutor: Single thread executor, so background writes run in order
+    """
+    global _CSV_EXECUTOR
+    if _CSV_EXECUTOR is None:
+        _CSV_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-writer")
+    return _CSV_EXECUTOR
+
+
+def save_forecasts_to_csv(
+    forecasts: pd.DataFrame, csv_dir: str, background: bool = False,
+) -> Optional[Union[str, Future]]:
+    """Save forecasts to a new, timestamped CSV file.
+
+    Each call writes `forecast_data_<UTC timestamp>.csv`, so earlier files are kept, and
+    files older than `CSV_RETENTION_DAYS` are removed, none if it is below 1. Files are
+    written with pyarrow, so the header and string values are quoted and timestamps look
+    like `2025-01-14 05:30:00.000000Z`. Frames pyarrow cannot write (e.g. mixed-type object
+    or list columns) are written by pandas instead, in its `2025-01-14 05:30:00+00:00` format.
+
+    With `background=True` the file is written on a single background thread, so the caller
+    can carry on, e.g. with database work, while it is written. Call `.result()` on the
+    returned future to wait for the write, get the file's path and re-raise any error.
 
     Parameters:
         forecasts (pd.DataFrame): DataFrame containing forecast data to save.
         csv_dir (str): Directory to save CSV files.
+        background (bool): Write the file on a background thread and return a future.
 
     Return:
-        None
+        Path of the CSV file, or a future for it when `background=True`. None if there were
+        no forecasts to save
     """
     # Check if forecasts is empty
     if forecasts.empty:
         logger.warning("No forecasts provided to save!")
-        return
+        return None
 
     if not csv_dir:  # check if directory csv directory provided
         raise ValueError("CSV directory is not provided for CSV saving.")
 
     os.makedirs(csv_dir, exist_ok=True)
-    csv_path = os.path.join(csv_dir, "forecast_data.csv")
+    csv_path = _timestamped_path(csv_dir, "csv")
 
-    try:
-        forecasts.drop(
-            columns=["_sa_instance_state"], errors="ignore", inplace=True
-        )  # Remove SQLAlchemy metadata
+    # Remove SQLAlchemy metadata. The projection is a new frame, so the writer thread does
+    # not see later changes the caller makes to theirs
+    forecasts = forecasts[forecasts.columns.difference(["_sa_instance_state"], sort=False)]
 
-        logger.info(f"Saving forecasts to CSV at {csv_path}")
-        forecasts.to_csv(csv_path, index=False)
-        logger.info(f"Successfully saved {len(forecasts)} forecasts to CSV.")
+    if background:
+        return _get_csv_executor().submit(_write_csv, forecasts, csv_path)
+    return _write_csv(forecasts, csv_path)
+
+
+def save_forecasts_to_parquet(forecasts: pd.DataFrame, parquet_dir: str) -> Optional[str]:
+    """Save forecasts to a new, timestamped, zstd compressed Parquet file.
+
+    Like CSVs, each call writes `forecast_data_<UTC timestamp>.parquet`, so earlier files
+    are kept, and files older than `CSV_RETENTION_DAYS` are removed, none if it is below 1.
+
+    Parameters:
+        forecasts (pd.DataFrame): DataFrame containing forecast data to save.
+        parquet_dir (str): Directory to save Parquet files.
+
+    Return:
+        Path of the Parquet file, or None if there were no forecasts to save
+    """
+    # Check if forecasts is empty
+    if forecasts.empty:
+        logger.warning("No forecasts provided to save!")
+        return None
+
+    if not parquet_dir:  # check if parquet directory provided
+        raise ValueError("Parquet directory is not provided for Parquet saving.")
+
+    os.makedirs(parquet_dir, exist_ok=True)
+    parquet_path = _timestamped_path(parquet_dir, "parquet")
+
+    try:
+        # Remove SQLAlchemy metadata
+        forecasts = forecasts[forecasts.columns.difference(["_sa_instance_state"], sort=False)]
+
+        logger.info(f"Saving forecasts to Parquet at {parquet_path}")
+        # "x" so an existing file is never overwritten
+        with open(parquet_path, "xb") as parquet_file:
+            forecasts.to_parquet(
+                parquet_file,
+                engine="pyarrow",
+                compression="zstd",
+                compression_level=3,
+                index=False,
+            )
+        logger.info(f"Successfully saved {len(forecasts)} forecasts to Parquet.")
     except Exception as e:
-        logger.error(f"An error occurred while saving forecasts to CSV: {e}")
+        logger.error(f"An error occurred while saving forecasts to Parquet: {e}")
         raise e
+
+    # The Parquet file is saved at this point, so failing to tidy up old ones is only logged
+    try:
+        _remove_old_forecast_files(
+            parquet_dir, "parquet", CSV_RETENTION_DAYS, keep_path=parquet_path
+        )
+    except Exception as e:
+        logger.warning(f"An error occurred while removing old forecast Parquet files: {e}")
+
+    return parquet_path
@@ -61,7 +61,7 @@ def test_real_forecasts(db_session, test_config):
 
     # Step 3B: Directly save to CSV
     csv_dir = test_config["csv_dir"]
-    save_forecasts_to_csv(
+    csv_path = save_forecasts_to_csv(
         forecasts=df,
         csv_dir=csv_dir,
     )
@@ -75,7 +75,7 @@ def test_real_forecasts(db_session, test_config):
     assert len(saved_forecast.forecast_values) > 0, "No forecast values were saved!"
 
     # Step 4B: Validate that the CSV file were saved correctly
-    csv_path = f"{csv_dir}/forecast_data.csv"
+    assert os.path.basename(csv_path).startswith("forecast_data_"), "Unexpected CSV name!"
     assert os.path.exists(csv_path), "CSV file was not created!"
     csv_data = pd.read_csv(csv_path)
     assert not csv_data.empty, "CSV file is empty!"
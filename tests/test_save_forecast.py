@@ -1,6 +1,25 @@
-from solar_consumer.save_forecast import save_generation_to_site_db, save_forecasts_to_site_db
+from solar_consumer.save_forecast import (
+    save_generation_to_site_db,
+    save_forecasts_to_site_db,
+    save_forecasts_to_parquet,
+    save_forecasts_to_csv,
+    get_existing_pvsites,
+    get_or_create_pvsite,
+    _split_by_site,
+    DE_TSO_SITES,
+    nl_national,
+    DE_TSO_CAPACITY,
+    CSV_RETENTION_DAYS,
+)
 from pvsite_datamodel.sqlmodels import GenerationSQL, ForecastSQL, ForecastValueSQL, LocationSQL
+from pvsite_datamodel.write.generation import insert_generation_values
+from concurrent.futures import Future
+from sqlalchemy.exc import OperationalError
+from unittest.mock import MagicMock, patch
+import os
+import time
 import pandas as pd
+import pytest
 
 
 def test_save_generation_to_site_db(db_site_session):
@@ -36,6 +55,77 @@ def test_save_generation_to_site_db(db_site_session):
     assert sites[0].client_location_name == "nl_national"
 
 
+def test_save_generation_to_site_db_rollback(db_site_session):
+
+    """
+    Test the save_generation_to_site_db function does not persist a new capacity
+    when the generation insert fails.
+    """
+    get_or_create_pvsite(db_site_session, nl_national, "nl")
+    db_site_session.commit()
+
+    generation_df = pd.DataFrame(
+        {
+            "target_datetime_utc": ["2023-10-01 00:00:00"],
+            "solar_generation_kw": [100],
+            "capacity_kw": [30_000_000],
+            "region_id": [0],
+        }
+    )
+
+    with patch(
+        "solar_consumer.save_forecast.insert_generation_values",
+        side_effect=RuntimeError("insert failed"),
+    ):
+        with pytest.raises(RuntimeError):
+            save_generation_to_site_db(
+                generation_data=generation_df,
+                session=db_site_session,
+            )
+
+    site = db_site_session.query(LocationSQL).one()
+    assert site.capacity_kw == 20_000_000
+    assert db_site_session.query(GenerationSQL).count() == 0
+
+
+def test_save_generation_to_site_db_de(db_site_session):
+
+    """
+    Test the save_generation_to_site_db function inserts all German TSOs in one call,
+    ignoring rows of unknown zones.
+    """
+    generation_df = pd.DataFrame(
+        {
+            "target_datetime_utc": ["2023-10-01 00:00:00", "2023-10-01 00:00:00",
+                                    "2023-10-01 01:00:00", "garbage"],
+            "solar_generation_kw": [100, 200, 300, 400],
+            "tso_zone": ["TenneT", "Amprion", "TenneT", "bogus"],
+        }
+    )
+
+    with patch(
+        "solar_consumer.save_forecast.insert_generation_values",
+        wraps=insert_generation_values,
+    ) as mock_insert:
+        save_generation_to_site_db(
+            generation_data=generation_df,
+            session=db_site_session,
+            country="de",
+        )
+
+    assert mock_insert.call_count == 1
+
+    sites = {site.location_uuid: site for site in db_site_session.query(LocationSQL).all()}
+    assert sorted(site.client_location_name for site in sites.values()) == ["Amprion", "TenneT"]
+
+    saved_data = db_site_session.query(GenerationSQL).all()
+    saved_power = sorted(
+        (sites[generation.location_uuid].client_location_name, generation.generation_power_kw)
+        for generation in saved_data
+    )
+    assert saved_power == [("Amprion", 200), ("TenneT", 100), ("TenneT", 300)]
+
+
 def test_save_forecasts_to_site_db(db_site_session):
 
     """
@@ -66,3 +156,289 @@ def test_save_forecasts_to_site_db(db_site_session):
 
     assert len(saved_data) == len(forecast_df)
 
+
+def test_save_forecasts_to_site_db_in_chunks(db_site_session):
+
+    """
+    Test the save_forecasts_to_site_db function inserts chunk_size rows at a time, all under
+    one forecast.
+    """
+    forecast_df = pd.DataFrame(
+        {
+            "target_datetime_utc": pd.to_datetime(
+                ["2023-10-01 00:00:00+00:00", "2023-10-01 00:15:00+00:00",
+                 "2023-10-01 00:30:00+00:00"]
+            ),
+            "solar_generation_kw": [100, 150, 200],
+        }
+    )
+
+    with patch.object(
+        db_site_session, "bulk_save_objects", wraps=db_site_session.bulk_save_objects
+    ) as mock_bulk_save:
+        save_forecasts_to_site_db(
+            forecast_data=forecast_df,
+            session=db_site_session,
+            model_tag="test-model",
+            model_version="1.0",
+            chunk_size=2,
+        )
+
+    assert [len(call.args[0]) for call in mock_bulk_save.call_args_list] == [2, 1]
+    assert len(db_site_session.query(ForecastSQL).all()) == 1
+    assert len(db_site_session.query(ForecastValueSQL).all()) == len(forecast_df)
+
+
+def test_save_forecasts_to_site_db_invalid_chunk_size(db_site_session):
+
+    """
+    Test the save_forecasts_to_site_db function rejects a chunk size below 1 before saving.
+    """
+    forecast_df = pd.DataFrame(
+        {
+            "target_datetime_utc": pd.to_datetime(["2023-10-01 00:00:00+00:00"]),
+            "solar_generation_kw": [100],
+        }
+    )
+
+    for chunk_size in [0, -5]:
+        with pytest.raises(ValueError):
+            save_forecasts_to_site_db(
+                forecast_data=forecast_df,
+                session=db_site_session,
+                model_tag="test-model",
+                model_version="1.0",
+                chunk_size=chunk_size,
+            )
+
+    assert len(db_site_session.query(ForecastSQL).all()) == 0
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_split_by_site_paths_match(monkeypatch, categorical):
+
+    """
+    Test the factorize and groupby paths of _split_by_site give the same groups,
+    dropping rows without a key and keeping unknown keys.
+    """
+    generation_df = pd.DataFrame(
+        {
+            "solar_generation_kw": [100, 200, 300, 400, 500, 600],
+            "tso_zone": ["TenneT", None, "Amprion", "bogus", "TenneT", float("nan")],
+        }
+    )
+    if categorical:
+        generation_df["tso_zone"] = pd.Categorical(
+            generation_df["tso_zone"], categories=list(DE_TSO_SITES) + ["bogus"]
+        )
+
+    factorized = _split_by_site(generation_df, "tso_zone")
+    monkeypatch.setattr("solar_consumer.save_forecast._SMALL_FRAME_ROWS", 0)
+    grouped = _split_by_site(generation_df, "tso_zone")
+
+    assert set(factorized) == set(grouped) == {"TenneT", "Amprion", "bogus"}
+    for zone in factorized:
+        pd.testing.assert_frame_equal(factorized[zone], grouped[zone])
+
+
+def test_get_existing_pvsites(db_site_session):
+
+    """
+    Test the get_existing_pvsites function only returns sites already in the database.
+    """
+    get_or_create_pvsite(db_site_session, DE_TSO_SITES["TenneT"], "de")
+
+    sites = get_existing_pvsites(db_site_session, DE_TSO_SITES.values())
+
+    assert list(sites) == ["TenneT"]
+    assert sites["TenneT"].capacity_kw == DE_TSO_CAPACITY["TenneT"]
+
+
+def test_get_or_create_pvsite_lookup_error():
+
+    """
+    Test the get_or_create_pvsite function lets lookup errors through without creating a site.
+    """
+    session = MagicMock()
+    session.query.side_effect = OperationalError("SELECT", {}, Exception("connection lost"))
+
+    with patch("solar_consumer.save_forecast.create_site") as mock_create_site:
+        with pytest.raises(OperationalError):
+            get_or_create_pvsite(session, DE_TSO_SITES["TenneT"], "de")
+
+    mock_create_site.assert_not_called()
+
+
+def test_save_forecasts_to_parquet(tmp_path):
+
+    """
+    Test the save_forecasts_to_parquet function round trips the forecast data.
+    """
+    forecast_df = pd.DataFrame(
+        {
+            "target_datetime_utc": pd.to_datetime(
+                ["2023-10-01 00:00:00+00:00", "2023-10-01 00:15:00+00:00"]
+            ),
+            "solar_generation_kw": [100.0, 150.0],
+        }
+    )
+
+    parquet_path = save_forecasts_to_parquet(forecasts=forecast_df, parquet_dir=str(tmp_path))
+
+    assert os.path.basename(parquet_path).startswith("forecast_data_")
+    saved_df = pd.read_parquet(parquet_path)
+    pd.testing.assert_frame_equal(saved_df, forecast_df)
+
+
+def test_save_forecasts_to_parquet_zero_retention(tmp_path, monkeypatch):
+
+    """
+    Test the save_forecasts_to_parquet function keeps the new file when the retention is 0.
+    """
+    monkeypatch.setattr("solar_consumer.save_forecast.CSV_RETENTION_DAYS", 0)
+
+    parquet_path = save_forecasts_to_parquet(
+        forecasts=pd.DataFrame({"solar_generation_kw": [1.5]}), parquet_dir=str(tmp_path)
+    )
+
+    assert os.path.exists(parquet_path)
+
+
+def test_save_forecasts_to_csv_format(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function writes pyarrow's header and timestamp format.
+    """
+    forecast_df = pd.DataFrame(
+        {
+            "target_datetime_utc": pd.to_datetime(["2025-01-14 05:30:00+00:00"]),
+            "solar_generation_kw": [101.5],
+        }
+    )
+
+    csv_path = save_forecasts_to_csv(forecasts=forecast_df, csv_dir=str(tmp_path))
+
+    with open(csv_path) as csv_file:
+        lines = csv_file.read().splitlines()
+    assert lines == [
+        '"target_datetime_utc","solar_generation_kw"',
+        "2025-01-14 05:30:00.000000Z,101.5",
+    ]
+
+
+def test_save_forecasts_to_csv_mixed_types(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function falls back to pandas for mixed-type columns.
+    """
+    forecast_df = pd.DataFrame({"a": [1, "x"]}, dtype=object)
+
+    csv_path = save_forecasts_to_csv(forecasts=forecast_df, csv_dir=str(tmp_path))
+
+    with open(csv_path) as csv_file:
+        assert csv_file.read().splitlines() == ["a", "1", "x"]
+
+
+def test_save_forecasts_to_csv_list_column(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function falls back to pandas for list columns,
+    leaving only the written file.
+    """
+    forecast_df = pd.DataFrame({"a": [[1, 2], [3]]})
+
+    csv_path = save_forecasts_to_csv(forecasts=forecast_df, csv_dir=str(tmp_path))
+
+    assert os.listdir(tmp_path) == [os.path.basename(csv_path)]
+    with open(csv_path) as csv_file:
+        assert csv_file.read().splitlines() == ["a", '"[1, 2]"', "[3]"]
+
+
+def test_save_forecasts_to_csv_write_error(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function leaves no partial file if the write fails.
+    """
+    forecast_df = pd.DataFrame({"a": [[1, 2], [3]]})
+
+    with patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            save_forecasts_to_csv(forecasts=forecast_df, csv_dir=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_save_forecasts_to_csv_background(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function returns a future for a background write.
+    """
+    forecast_df = pd.DataFrame({"solar_generation_kw": [101.5]})
+
+    csv_write = save_forecasts_to_csv(
+        forecasts=forecast_df, csv_dir=str(tmp_path), background=True
+    )
+
+    assert isinstance(csv_write, Future)
+    pd.testing.assert_frame_equal(pd.read_csv(csv_write.result()), forecast_df)
+
+
+def test_save_forecasts_to_csv_rotation(tmp_path):
+
+    """
+    Test the save_forecasts_to_csv function keeps earlier files and removes expired ones.
+    """
+    old_csv_path = tmp_path / "forecast_data_20000101T000000000000Z.csv"
+    old_csv_path.write_text("solar_generation_kw\n1.0\n")
+    expired = time.time() - (CSV_RETENTION_DAYS + 1) * 24 * 60 * 60
+    os.utime(old_csv_path, (expired, expired))
+
+    first_csv_path = save_forecasts_to_csv(
+        forecasts=pd.DataFrame({"solar_generation_kw": [1.5]}), csv_dir=str(tmp_path)
+    )
+    second_csv_path = save_forecasts_to_csv(
+        forecasts=pd.DataFrame({"solar_generation_kw": [2.5]}), csv_dir=str(tmp_path)
+    )
+
+    assert first_csv_path != second_csv_path
+    assert not old_csv_path.exists()
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [os.path.basename(first_csv_path), os.path.basename(second_csv_path)]
+    )
+    assert pd.read_csv(first_csv_path)["solar_generation_kw"].tolist() == [1.5]
+    assert pd.read_csv(second_csv_path)["solar_generation_kw"].tolist() == [2.5]
+
+
+def test_save_forecasts_to_csv_pruning_error(tmp_path, monkeypatch):
+
+    """
+    Test the save_forecasts_to_csv function still reports a saved CSV if pruning fails.
+    """
+    def raise_not_found(*args, **kwargs):
+        raise FileNotFoundError("already removed")
+
+    monkeypatch.setattr("solar_consumer.save_forecast._remove_old_forecast_files", raise_not_found)
+
+    csv_path = save_forecasts_to_csv(
+        forecasts=pd.DataFrame({"solar_generation_kw": [1.5]}), csv_dir=str(tmp_path)
+    )
+
+    assert os.path.exists(csv_path)
+
+
+def test_save_forecasts_to_csv_zero_retention(tmp_path, monkeypatch):
+
+    """
+    Test the save_forecasts_to_csv function removes no files when the retention is 0.
+    """
+    monkeypatch.setattr("solar_consumer.save_forecast.CSV_RETENTION_DAYS", 0)
+    old_csv_path = tmp_path / "forecast_data_20000101T000000000000Z.csv"
+    old_csv_path.write_text("solar_generation_kw\n1.0\n")
+    os.utime(old_csv_path, (0, 0))
+
+    csv_path = save_forecasts_to_csv(
+        forecasts=pd.DataFrame({"solar_generation_kw": [1.5]}), csv_dir=str(tmp_path)
+    )
+
+    assert os.path.exists(csv_path)
+    assert old_csv_path.exists()